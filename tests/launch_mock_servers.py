@@ -9,6 +9,7 @@ import time
 import requests
 import signal
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Server configurations
 SERVERS = [
@@ -29,14 +30,46 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
+def wait_for_server(server):
+    """Poll a mock server's health endpoint until it responds."""
+    # Back off exponentially from 20ms to 500ms; 34 retries keeps the
+    # total wait budget at roughly 15s per server.
+    max_retries = 34
+    delay = 0.02
+    # One keep-alive session per server: it talks to a single host and is
+    # only used from this probe's thread.
+    session = requests.Session()
+    for i in range(max_retries):
+        try:
+            resp = session.get(f"http://127.0.0.1:{server['port']}/health", timeout=1)
+            if resp.status_code == 200:
+                print(f"✓ {server['name']} is ready")
+                return
+        except requests.exceptions.RequestException as e:
+            if i == max_retries - 1:
+                print(f"✗ {server['name']} failed to start after {max_retries} retries")
+                print(f"   Last error: {e}")
+                raise
+        # Server not ready yet, continue waiting
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    raise RuntimeError(f"{server['name']} did not report healthy after {max_retries} retries")
+
+
 def start_servers():
     """Start all mock KairosDB servers."""
     global processes
     
+    # Pass the script by absolute path instead of setting cwd: together with
+    # close_fds=False this lets subprocess use posix_spawn rather than
+    # fork+exec. Python creates its own fds non-inheritable, so nothing leaks.
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_kairosdb_server.py")
+    
+    # Spawn every server up front so their interpreter start-up overlaps
     for server in SERVERS:
         cmd = [
             sys.executable,
-            "mock_kairosdb_server.py",
+            script,
             str(server["port"]),
             server["name"]
         ]
@@ -46,28 +79,22 @@ def start_servers():
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            cwd=os.path.dirname(__file__)
+            close_fds=False
         )
         processes.append(proc)
-        time.sleep(0.5)
     
     # Wait for servers to be ready
     print("Waiting for servers to be ready...")
-    for server in SERVERS:
-        max_retries = 30
-        for i in range(max_retries):
-            try:
-                resp = requests.get(f"http://127.0.0.1:{server['port']}/health", timeout=1)
-                if resp.status_code == 200:
-                    print(f"✓ {server['name']} is ready")
-                    break
-            except requests.exceptions.RequestException as e:
-                if i == max_retries - 1:
-                    print(f"✗ {server['name']} failed to start after {max_retries} retries")
-                    print(f"   Last error: {e}")
-                    raise
-                # Server not ready yet, continue waiting
-                time.sleep(0.5)
+    with ThreadPoolExecutor(max_workers=len(SERVERS)) as executor:
+        futures = [executor.submit(wait_for_server, server) for server in SERVERS]
+    try:
+        for future in futures:
+            future.result()
+    except Exception:
+        for proc in processes:
+            proc.kill()
+            proc.wait()
+        raise
     
     print("All mock servers are ready!")
     return processes
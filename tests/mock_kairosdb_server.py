@@ -2,26 +2,94 @@
 """
 Mock KairosDB server for integration testing.
 This server simulates KairosDB behavior by capturing payloads and returning consistent responses.
-Uses Bottle.py - a lightweight, single-file micro-framework with minimal resource usage.
+Uses Bottle.py - a lightweight, single-file micro-framework with minimal resource usage -
+served by FastWSGI, whose libuv/llhttp core keeps the accept/parse/respond loop in C.
 """
 
-import json
+import collections
 import sys
-from bottle import Bottle, request, response, run
+import threading
+import fastwsgi
+import orjson
+from bottle import Bottle, request, response
 
-# Store received requests for validation
-received_requests = []
+# Store the most recent received requests for validation
+received_requests = collections.deque(maxlen=1024)
+# Uncontended under FastWSGI's single libuv thread; only matters if the mock
+# moves to a threaded or gevent server.
+received_requests_lock = threading.Lock()
+
+# Placeholder metric name baked into the pre-serialized response templates
+METRIC_SENTINEL = "__METRIC__"
+METRIC_SENTINEL_BYTES = orjson.dumps(METRIC_SENTINEL)
+
+
+def render_metrics(template, payload):
+    """Render one copy of a response template per metric in the payload."""
+    if not payload or 'metrics' not in payload:
+        return b""
+    return b",".join(
+        template.replace(
+            METRIC_SENTINEL_BYTES,
+            orjson.dumps(metric.get('name', 'unknown'))
+        )
+        for metric in payload['metrics']
+    )
+
+
+def read_json_body():
+    """
+    Decode a JSON request body with orjson.
+
+    Mirrors Bottle's request.json: returns None unless the request is sent with
+    a JSON content type and a non-empty body.
+    """
+    ctype = request.environ.get('CONTENT_TYPE', '').lower().split(';')[0]
+    if ctype not in ('application/json', 'application/json-rpc'):
+        return None
+    body = request.body.read()
+    return orjson.loads(body) if body else None
 
 
 def create_app(server_name):
     """Create a Bottle app that simulates KairosDB behavior."""
     app = Bottle()
 
+    health_body = orjson.dumps({"status": "ok", "server": server_name})
+
+    # Response bodies are identical for every request apart from the metric
+    # name, so serialize them once (with server_name already encoded) and
+    # splice the name in per metric.
+    query_template = orjson.dumps({
+        "sample_size": 10,
+        "results": [
+            {
+                "name": METRIC_SENTINEL,
+                "group_by": [],
+                "tags": {
+                    "host": [server_name]
+                },
+                "values": [
+                    [1609459200000, 42.5],
+                    [1609459260000, 43.0],
+                    [1609459320000, 43.5]
+                ]
+            }
+        ]
+    })
+    tag_template = orjson.dumps({
+        "name": METRIC_SENTINEL,
+        "tags": {
+            "host": [server_name],
+            "region": ["us-east-1"]
+        }
+    })
+
     @app.route('/health', method='GET')
     def health():
         """Health check endpoint."""
         response.content_type = 'application/json'
-        return json.dumps({"status": "ok", "server": server_name})
+        return health_body
 
     @app.route('/api/v1/datapoints/query', method='POST')
     def query_datapoints():
@@ -30,51 +98,24 @@ def create_app(server_name):
         Captures the request payload and returns a consistent response.
         """
         try:
-            payload = request.json
+            payload = read_json_body()
             
             # Store the request for validation
-            received_requests.append({
-                'endpoint': '/api/v1/datapoints/query',
-                'payload': payload,
-                'server': server_name,
-                'headers': dict(request.headers)
-            })
-            
-            # Return a mock KairosDB response
-            result = {
-                "queries": []
-            }
-            
-            # Generate mock results for each metric in the request
-            if payload and 'metrics' in payload:
-                for metric in payload['metrics']:
-                    metric_name = metric.get('name', 'unknown')
-                    query_result = {
-                        "sample_size": 10,
-                        "results": [
-                            {
-                                "name": metric_name,
-                                "group_by": [],
-                                "tags": {
-                                    "host": [server_name]
-                                },
-                                "values": [
-                                    [1609459200000, 42.5],
-                                    [1609459260000, 43.0],
-                                    [1609459320000, 43.5]
-                                ]
-                            }
-                        ]
-                    }
-                    result["queries"].append(query_result)
+            with received_requests_lock:
+                received_requests.append({
+                    'endpoint': '/api/v1/datapoints/query',
+                    'payload': payload,
+                    'server': server_name
+                })
             
+            # Return a mock KairosDB response with one result per metric
             response.content_type = 'application/json'
-            return json.dumps(result)
+            return b'{"queries":[' + render_metrics(query_template, payload) + b']}'
             
         except Exception as e:
             response.status = 400
             response.content_type = 'application/json'
-            return json.dumps({"error": str(e)})
+            return orjson.dumps({"error": str(e)})
 
     @app.route('/api/v1/datapoints/query/tags', method='POST')
     def query_tags():
@@ -83,53 +124,39 @@ def create_app(server_name):
         Captures the request payload and returns a consistent response.
         """
         try:
-            payload = request.json
+            payload = read_json_body()
             
             # Store the request for validation
-            received_requests.append({
-                'endpoint': '/api/v1/datapoints/query/tags',
-                'payload': payload,
-                'server': server_name,
-                'headers': dict(request.headers)
-            })
+            with received_requests_lock:
+                received_requests.append({
+                    'endpoint': '/api/v1/datapoints/query/tags',
+                    'payload': payload,
+                    'server': server_name
+                })
             
             # Return a mock tag query response
-            result = {
-                "results": []
-            }
-            
-            if payload and 'metrics' in payload:
-                for metric in payload['metrics']:
-                    metric_name = metric.get('name', 'unknown')
-                    tag_result = {
-                        "name": metric_name,
-                        "tags": {
-                            "host": [server_name],
-                            "region": ["us-east-1"]
-                        }
-                    }
-                    result["results"].append(tag_result)
-            
             response.content_type = 'application/json'
-            return json.dumps(result)
+            return b'{"results":[' + render_metrics(tag_template, payload) + b']}'
             
         except Exception as e:
             response.status = 400
             response.content_type = 'application/json'
-            return json.dumps({"error": str(e)})
+            return orjson.dumps({"error": str(e)})
 
     @app.route('/debug/requests', method='GET')
     def get_requests():
         """Debug endpoint to retrieve all received requests."""
         response.content_type = 'application/json'
-        return json.dumps(received_requests)
+        with received_requests_lock:
+            return orjson.dumps(list(received_requests))
 
     @app.route('/debug/clear', method='POST')
     def clear_requests():
         """Debug endpoint to clear stored requests."""
-        received_requests.clear()
+        with received_requests_lock:
+            received_requests.clear()
         response.content_type = 'application/json'
-        return json.dumps({"status": "cleared"})
+        return orjson.dumps({"status": "cleared"})
 
     return app
 
@@ -146,9 +173,8 @@ def main():
     app = create_app(server_name)
     print(f"Starting mock KairosDB server '{server_name}' on port {port}...")
     
-    # Bottle's built-in server is lightweight and sufficient for testing
-    # quiet=True suppresses the default startup message for cleaner output
-    run(app, host='127.0.0.1', port=port, quiet=True)
+    # Bottle apps are plain WSGI callables, so FastWSGI can serve them directly
+    fastwsgi.run(wsgi_app=app, host='127.0.0.1', port=port)
 
 
 if __name__ == '__main__':
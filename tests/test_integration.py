@@ -10,12 +10,14 @@ These tests validate that:
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import subprocess
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Configuration
@@ -27,34 +29,64 @@ MOCK_SERVERS = [
 ]
 
 
-def wait_for_service(url, max_retries=30, timeout=1):
-    """Wait for a service to become available."""
+def create_session():
+    """Create a requests session that keeps connections to local services alive."""
+    session = requests.Session()
+    # One pool each for the proxy and the three mock servers
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = create_session()
+
+# Reused across tests so setup doesn't pay thread start-up on every call.
+# Each mock server gets its own session because requests.Session is not
+# documented as thread-safe.
+CLEAR_EXECUTOR = ThreadPoolExecutor(max_workers=len(MOCK_SERVERS))
+CLEAR_SESSIONS = {server["url"]: requests.Session() for server in MOCK_SERVERS}
+
+
+def wait_for_service(url, max_retries=34, timeout=1):
+    """
+    Wait for a service to become available.
+
+    Polls with exponential backoff from 20ms up to 500ms, so a service that is
+    ready quickly is detected quickly; the default retry count keeps the total
+    wait budget at roughly 15s.
+    """
+    delay = 0.02
     for i in range(max_retries):
         try:
-            resp = requests.get(f"{url}/health", timeout=timeout)
+            resp = SESSION.get(f"{url}/health", timeout=timeout)
             if resp.status_code == 200:
                 return True
         except requests.exceptions.RequestException:
-            if i == max_retries - 1:
-                return False
-            time.sleep(0.5)
+            pass
+        if i < max_retries - 1:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     return False
 
 
+def clear_mock_server_request(server):
+    """Clear stored requests on a single mock server."""
+    try:
+        CLEAR_SESSIONS[server["url"]].post(f"{server['url']}/debug/clear", timeout=1)
+    except Exception:
+        # Ignore errors when clearing, server might be unavailable
+        pass
+
+
 def clear_mock_server_requests():
-    """Clear all stored requests on mock servers."""
-    for server in MOCK_SERVERS:
-        try:
-            requests.post(f"{server['url']}/debug/clear", timeout=1)
-        except Exception:
-            # Ignore errors when clearing, server might be unavailable
-            pass
+    """Clear all stored requests on mock servers concurrently."""
+    list(CLEAR_EXECUTOR.map(clear_mock_server_request, MOCK_SERVERS))
 
 
 def get_mock_server_requests(server_url):
     """Get all requests received by a mock server."""
     try:
-        resp = requests.get(f"{server_url}/debug/requests", timeout=1)
+        resp = SESSION.get(f"{server_url}/debug/requests", timeout=1)
         if resp.status_code == 200:
             return resp.json()
     except Exception:
@@ -68,7 +100,7 @@ class TestProxyHealth:
     
     def test_proxy_health_endpoint(self):
         """Test that the proxy health endpoint responds correctly."""
-        resp = requests.get(f"{PROXY_URL}/health", timeout=5)
+        resp = SESSION.get(f"{PROXY_URL}/health", timeout=5)
         assert resp.status_code == 200
         data = resp.json()
         assert "status" in data
@@ -101,7 +133,7 @@ class TestPayloadConsistency:
         }
         
         # Send request through proxy
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -136,7 +168,7 @@ class TestPayloadConsistency:
         }
         
         # Send request through proxy
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -179,7 +211,7 @@ class TestPayloadConsistency:
         }
         
         # Send request through proxy
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -219,7 +251,7 @@ class TestTagQueries:
         }
         
         # Send request through proxy
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query/tags",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -255,7 +287,7 @@ class TestResponseConsistency:
             ]
         }
         
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -290,7 +322,7 @@ class TestResponseConsistency:
             ]
         }
         
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -328,7 +360,7 @@ class TestMultipleMetrics:
             ]
         }
         
-        resp = requests.post(
+        resp = SESSION.post(
             f"{PROXY_URL}/api/v1/datapoints/query",
             json=payload,
             headers={"Content-Type": "application/json"},